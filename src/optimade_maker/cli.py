@@ -27,11 +27,16 @@ def cli():
     type=int,
     help="Limit the ingestion to a fixed number of structures (useful for testing).",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always convert the archive, rather than reusing a cached conversion.",
+)
 @click.argument(
     "path",
     type=click.Path(),
 )
-def convert(jsonl_path, path, limit=None):
+def convert(jsonl_path, path, limit=None, no_cache=False):
     """
     Convert a raw data archive into OPTIMADE JSONL.
 
@@ -43,7 +48,9 @@ def convert(jsonl_path, path, limit=None):
         jsonl_path = Path(jsonl_path)
         if jsonl_path.exists():
             raise FileExistsError(f"File already exists at {jsonl_path}.")
-    convert_archive(Path(path), jsonl_path=jsonl_path, limit=limit)
+    convert_archive(
+        Path(path), jsonl_path=jsonl_path, limit=limit, use_cache=not no_cache
+    )
 
 
 @cli.command()
@@ -4,13 +4,28 @@ OPTIMADE API.
 
 """
 
+import contextlib
 import datetime
+import fnmatch
+import functools
+import hashlib
+import io
+import itertools
 import os
+import queue
+import shutil
+import stat
+import subprocess
+import threading
 import warnings
+import zipfile
 from collections import defaultdict
-from pathlib import Path
-from typing import Any, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
+import orjson
 import tqdm
 from optimade import __api_version__ as OPTIMADE_API_VERSION
 from optimade.models import EntryInfoResource, EntryResource
@@ -20,6 +35,61 @@ from .config import Config, EntryConfig, JSONLConfig, ParsedFiles, PropertyDefin
 
 PROVIDER_PREFIX = os.environ.get("OPTIMAKE_PROVIDER_PREFIX", "optimake")
 
+# Prefix of internal ASE fields that are stripped from entries before writing
+_ASE_PREFIX = "_ase"
+
+# Below this number of entry files, parsing is done in the main process
+_MIN_FILES_FOR_PROCESS_POOL = 32
+
+# Directory within each archive where converted JSONL files are cached
+_CACHE_DIRECTORY = ".optimake_cache"
+
+# Packages whose versions are part of the cache key, as they affect the output
+_CACHE_KEY_PACKAGES = ("optimade_maker", "optimade", "ase", "pymatgen", "pandas")
+
+
+def _max_concurrent_writes(default: int = 8) -> int:
+    """Read the `OPTIMAKE_MAX_CONCURRENT_WRITES` environment variable, which
+    must be a positive integer; falls back to `default` if it is not set or invalid.
+
+    """
+    value = os.environ.get("OPTIMAKE_MAX_CONCURRENT_WRITES")
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        warnings.warn(
+            f"Ignoring invalid OPTIMAKE_MAX_CONCURRENT_WRITES={value!r}, "
+            f"using {default} instead"
+        )
+        return default
+
+
+# Caps the number of files being written to disk at once across all concurrent
+# `inflate_archive` calls, so that inflating several archives in parallel does not
+# exceed the available I/O bandwidth; each zip extraction thread, streamed tar
+# member and system `tar` process holds one slot while it writes
+_INFLATE_WRITE_SLOTS = threading.BoundedSemaphore(_max_concurrent_writes())
+
+# Multi-threaded replacements for the `gzip` and `bzip2` command-line tools,
+# used to decompress archives when installed
+_PARALLEL_DECOMPRESSORS: dict[str, str] = {".gz": "pigz", ".bz2": "pbzip2"}
+
+
+@functools.lru_cache(maxsize=None)
+def _default_properties_for(type: str) -> dict[str, Any]:
+    """Return the standard OPTIMADE properties for the given entry type, if any.
+
+    The result is cached and shared between calls, so must not be modified.
+
+    """
+    if type not in ENTRY_INFO_SCHEMAS:
+        return {}
+    return retrieve_queryable_properties(
+        ENTRY_INFO_SCHEMAS[type], {"id", "type", "attributes"}
+    )
+
 
 def _construct_entry_type_info(
     type: str,
@@ -33,17 +103,13 @@ def _construct_entry_type_info(
 
     """
 
-    default_properties = {}
-    if type in ENTRY_INFO_SCHEMAS:
-        default_properties = retrieve_queryable_properties(
-            ENTRY_INFO_SCHEMAS[type], {"id", "type", "attributes"}
-        )
+    default_properties = _default_properties_for(type)
 
     info: dict[str, Any] = {"formats": ["json"], "description": type}
     info["properties"] = {}
     for p in properties:
         if isinstance(p, PropertyDefinition):
-            p = p.dict()
+            p = p.model_dump()
 
         p_name = (
             f"_{provider_prefix}_{p['name']}"
@@ -64,15 +130,31 @@ def _construct_entry_type_info(
 
 
 def convert_archive(
-    archive_path: Path, jsonl_path: Path | None = None, limit: int | None = None
+    archive_path: Path,
+    jsonl_path: Path | None = None,
+    limit: int | None = None,
+    max_concurrency: int | None = None,
+    use_cache: bool = True,
 ) -> Path:
     """Convert an MCloud entry to an OPTIMADE JSONL file.
 
+    The converted file is cached under `<archive_path>/.optimake_cache`,
+    and reused by later conversions if the config and data files (and the
+    versions of the packages used to convert them) are unchanged. Only the
+    most recent conversion is kept in the cache.
+
     Parameters:
         archive_path: The location of the `optimade.yaml` file to convert.
         jsonl_path: The location to write the JSONL file to. If not provided,
             write to `<archive_path>/optimade.jsonl`.
         limit: The maximum number of entries to parse (useful for testing).
+        max_concurrency: The maximum number of compressed data paths to inflate
+            at once. Defaults to half the available CPUs, to avoid saturating
+            disk I/O.
+        use_cache: Whether to reuse and update the cached conversion; if not,
+            the archive is always converted, straight to `jsonl_path`.
+            The cache is also skipped when it cannot be used, e.g., for
+            read-only archives.
 
     Raises:
         FileNotFoundError: If any of the data paths in the config file,
@@ -90,9 +172,14 @@ def convert_archive(
     # if the config specifies just a JSON-L, then extract any archives
     # and return the JSONL path
     if isinstance(mc_config.entries, JSONLConfig):
-        if mc_config.entries.file is not None:
-            inflate_archive(archive_path, Path(mc_config.entries.file))
         src_jsonl_path = archive_path / mc_config.entries.jsonl_path
+        if mc_config.entries.file is not None:
+            # the JSONL file may have been removed since it was last extracted
+            inflate_archive(
+                archive_path,
+                Path(mc_config.entries.file),
+                force=not src_jsonl_path.exists(),
+            )
         if jsonl_path != src_jsonl_path:
             # add a symlink to the specified jsonl_path
             if jsonl_path.exists():
@@ -100,93 +187,512 @@ def convert_archive(
             jsonl_path.symlink_to(archive_path / src_jsonl_path)
         return jsonl_path
 
-    # first, decompress any provided data paths
-    data_paths: set[Path] = set()
+    if jsonl_path.exists():
+        raise RuntimeError(f"Not overwriting existing file at {jsonl_path}")
+
+    # reuse the output of a previous conversion of identical inputs, if any
+    _clear_match_caches()
+    output_path = jsonl_path
+    if use_cache:
+        try:
+            cache_path = (
+                archive_path
+                / _CACHE_DIRECTORY
+                / f"{_conversion_cache_key(archive_path, mc_config, limit)}.jsonl"
+            )
+            if cache_path.exists():
+                _link_or_copy(cache_path, jsonl_path)
+                return jsonl_path
+            cache_path.parent.mkdir(exist_ok=True)
+            if not os.access(cache_path.parent, os.W_OK):
+                raise PermissionError(f"Cannot write to {cache_path.parent}")
+        except (OSError, PackageNotFoundError):
+            # e.g., a read-only archive, or running from an uninstalled
+            # source tree, so convert without the cache
+            use_cache = False
+        else:
+            output_path = cache_path
+
+    # group the entry configs by type (in order of first appearance), and
+    # gather the compressed data paths, in one pass
+    entries_by_type: dict[str, list[EntryConfig]] = {}
+    data_files: set[str] = set()
     for entry in mc_config.entries:
-        for e in entry.entry_paths:
+        entries_by_type.setdefault(entry.entry_type, []).append(entry)
+        for e in entry.entry_paths + entry.property_paths:
             if e.matches:
-                data_paths.add((archive_path / str(e.file)).resolve())
-        for p in entry.property_paths:
-            if p.matches:
-                data_paths.add((archive_path / str(p.file)).resolve())
+                data_files.add(str(e.file))
 
-    for data_path in data_paths:
-        inflate_archive(archive_path, data_path)
+    property_definitions = {
+        entry_type: list(
+            itertools.chain.from_iterable(e.property_definitions for e in entries)
+        )
+        for entry_type, entries in entries_by_type.items()
+    }
 
-    optimade_entries: dict[str, list[dict]] = defaultdict(list)
+    # merge equivalent spellings of the same file lexically, keeping them
+    # relative to the archive; `inflate_archive` joins and resolves each one
+    data_paths = {Path(os.path.normpath(f)) for f in data_files}
 
-    for entry in mc_config.entries:
-        optimade_entries[entry.entry_type].extend(
-            construct_entries(
-                archive_path, entry, PROVIDER_PREFIX, limit=limit
-            ).values()
+    # first, decompress any provided data paths
+    _inflate_data_paths(archive_path, data_paths, max_concurrency)
+
+    # Collect the files for every entry up front, so that any missing files
+    # are reported before any of the (potentially slow) parsing begins
+    try:
+        matches = _collect_matches(archive_path, entries_by_type)
+    except FileNotFoundError:
+        if not data_paths:
+            raise
+        # extracted files may have been removed since the archives were
+        # last inflated, so inflate them again regardless of their markers
+        _inflate_data_paths(archive_path, data_paths, max_concurrency, force=True)
+        matches = _collect_matches(archive_path, entries_by_type)
+
+    # Share one process pool between all the entry specifications that need it,
+    # and start its workers before the writer thread below, as forking a
+    # process that is already running other threads risks deadlocks
+    needs_pool = any(
+        _count_entry_files(entry_matches_by_file, limit) >= _MIN_FILES_FOR_PROCESS_POOL
+        for entry_matches in matches.values()
+        for _, entry_matches_by_file, _ in entry_matches
+    )
+    with (
+        ProcessPoolExecutor(max_workers=os.cpu_count())
+        if needs_pool
+        else contextlib.nullcontext()
+    ) as executor:
+        if executor is not None:
+            executor.submit(int).result()
+
+        # Stream each entry to the JSONL file as soon as it has been constructed,
+        # with all entries of the same type written together
+        with _JSONLWriter(output_path) as writer:
+            for line in _serialize_jsonl_header(property_definitions, PROVIDER_PREFIX):
+                writer.write(line)
+
+            for entry_type in matches:
+                # IDs need only be unique within each entry type
+                seen_ids: set[str] = set()
+                for entry, entry_matches_by_file, property_matches_by_file in matches[
+                    entry_type
+                ]:
+                    for _, entry_dict in construct_entries(
+                        archive_path,
+                        entry,
+                        PROVIDER_PREFIX,
+                        limit=limit,
+                        seen_ids=seen_ids,
+                        entry_matches_by_file=entry_matches_by_file,
+                        property_matches_by_file=property_matches_by_file,
+                        executor=executor,
+                    ):
+                        writer.write(_serialize_entry(entry_dict))
+
+    if use_cache:
+        # drop conversions of earlier versions of the inputs, which can no
+        # longer be reused (any previous outputs linked to them are kept)
+        for stale_path in output_path.parent.glob("*.jsonl"):
+            if stale_path != output_path:
+                stale_path.unlink(missing_ok=True)
+        _link_or_copy(output_path, jsonl_path)
+
+    return jsonl_path
+
+
+def _conversion_cache_key(
+    archive_path: Path, mc_config: Config, limit: int | None
+) -> str:
+    """Hash everything that the converted JSONL depends on: the versions of this
+    package, the OPTIMADE API and the parsing libraries, the conversion options,
+    and the size and modification time of the config and every data file it
+    references.
+
+    Raises:
+        PackageNotFoundError: If any of the packages are not installed.
+
+    """
+    assert not isinstance(mc_config.entries, JSONLConfig)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(
+        orjson.dumps(
+            [
+                *(version(package) for package in _CACHE_KEY_PACKAGES),
+                OPTIMADE_API_VERSION,
+                PROVIDER_PREFIX,
+                limit,
+            ]
+        )
+    )
+
+    # the version of an editable install does not change with its code, so
+    # also include the source files of this package itself
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        stat_result = source.stat()
+        hasher.update(
+            orjson.dumps([source.name, stat_result.st_mtime_ns, stat_result.st_size])
         )
 
-    property_definitions = defaultdict(list)
+    paths: set[Path] = {archive_path / "optimade.yaml"}
     for entry in mc_config.entries:
-        property_definitions[entry.entry_type].extend(entry.property_definitions)
-
-    jsonl_path = write_optimade_jsonl(
-        archive_path,
-        optimade_entries,
-        property_definitions,
-        PROVIDER_PREFIX,
-        jsonl_path,
-    )
+        for parsed_files in entry.entry_paths + entry.property_paths:
+            file_path = archive_path / parsed_files.file
+            paths.add(file_path)
+            # matches in an uncompressed directory are read in place, so
+            # the directory's own modification time is not enough
+            if file_path.is_dir():
+                for m in parsed_files.matches or []:
+                    if "*" in m:
+                        paths.update(_cached_glob(archive_path, m))
+                    else:
+                        paths.add(archive_path / m)
 
-    return jsonl_path
+    for path in sorted(paths):
+        try:
+            stat_result = path.stat()
+            stamp = [stat_result.st_mtime_ns, stat_result.st_size]
+        except FileNotFoundError:
+            # missing files are reported once the conversion is attempted
+            stamp = None
+        hasher.update(orjson.dumps([str(path.relative_to(archive_path)), stamp]))
+
+    return hasher.hexdigest()
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard link `source` to `destination`, copying it instead where links are
+    not possible (e.g., across file systems).
+
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _inflate_data_paths(
+    archive_path: Path,
+    data_paths: set[Path],
+    max_concurrency: int | None = None,
+    force: bool = False,
+) -> None:
+    """Inflate each of the data paths concurrently (see `inflate_archive`),
+    then discard any cached directory listings as the archive contents may
+    have changed.
+
+    """
+    if data_paths:
+        if max_concurrency is None:
+            max_concurrency = max(1, (os.cpu_count() or 1) // 2)
+        max_workers = min(len(data_paths), max_concurrency)
+        # share the CPUs between the archives being decompressed at once
+        threads = max(1, (os.cpu_count() or 1) // max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    inflate_archive, archive_path, data_path, force, threads
+                )
+                for data_path in data_paths
+            ]
+            # re-raise the first failure (e.g., a missing file) as soon as it occurs
+            for future in as_completed(futures):
+                future.result()
 
+    _clear_match_caches()
 
-def inflate_archive(archive_path: Path, data_path: Path) -> None:
+
+def inflate_archive(
+    archive_path: Path,
+    data_path: Path,
+    force: bool = False,
+    threads: int | None = None,
+) -> None:
     """For a given compressed file in an archive entry, decompress it and place
     the contents at the root of the archive entry file system.
 
     Supports .tar.bz2, .tar.gz and .zip files, as well as individually compressed
     <x>.gz and <x>.bz2 files.
 
+    Gzip and bzip2 data is decompressed with `pigz` or `pbzip2` when they
+    are installed, falling back to Python's own decompression otherwise.
+    Without them, gzipped data is decompressed with up to `threads` threads
+    (defaulting to the number of CPUs) if `rapidgzip` is installed.
+
+    Once inflated, a `<data_path>.inflated` marker recording the size and
+    modification time of the compressed file is written next to it, and
+    later calls return immediately while the compressed file is unchanged,
+    unless `force` is set (e.g., because extracted files have since been
+    removed). The marker does not record which files were extracted, so
+    callers must check for any missing files themselves: if only some of
+    the extracted files are removed (e.g., so that a wildcard still matches
+    the others), they are not restored without `force`.
+
     """
     import bz2
-    import gzip
     import tarfile
-    import zipfile
 
     real_path = (Path(archive_path) / data_path).resolve()
     if not real_path.exists():
         raise FileNotFoundError(f"Could not find archive at {real_path=}")
 
+    stat_result = real_path.stat()
+    stamp = f"{stat_result.st_mtime_ns}:{stat_result.st_size}"
+    marker = real_path.with_name(f"{real_path.name}.inflated")
+    try:
+        if not force and marker.read_text() == stamp:
+            return
+    except FileNotFoundError:
+        pass
+
     if real_path.suffix == ".zip":
-        with zipfile.ZipFile(real_path, "r") as zip_ref:
-            zip_ref.extractall(real_path.parent)
+        _extract_zip_members(real_path, real_path.parent)
+
+    # If .tar in filename suffixes, prefer the system `tar` with a parallel
+    # decompressor where both are available
+    elif ".tar" in real_path.suffixes and (
+        (tar_program := shutil.which("tar"))
+        and (decompressor := _find_parallel_decompressor(real_path))
+    ):
+        with _INFLATE_WRITE_SLOTS:
+            subprocess.run(
+                [
+                    tar_program,
+                    f"--use-compress-program={decompressor}",
+                    "-xf",
+                    str(real_path),
+                    "-C",
+                    str(real_path.parent),
+                ],
+                check=True,
+            )
 
-    # If .tar in filename suffixes, use `tarfile`'s compression detection
+    # Otherwise use `tarfile`'s compression detection,
+    # streaming the archive rather than seeking through it
     elif ".tar" in real_path.suffixes:
-        with tarfile.open(real_path, "r") as tar:
-            tar.extractall(path=real_path.parent)
+        with _open_tar_stream(real_path, threads=threads) as stream:
+            with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                # Extract member-by-member so only one member is held at a time;
+                # as in `extractall`, directory attributes are only set once all
+                # members are written, so that later members can still be
+                # written into read-only directories
+                directories: list[tarfile.TarInfo] = []
+                for member in tar:
+                    if member.isdir():
+                        directories.append(member)
+                    with _INFLATE_WRITE_SLOTS:
+                        tar.extract(
+                            member, path=real_path.parent, set_attrs=not member.isdir()
+                        )
+
+                # set the attributes of the deepest directories first
+                for member in sorted(directories, key=lambda m: m.name, reverse=True):
+                    directory = os.path.join(real_path.parent, member.name)
+                    try:
+                        tar.chown(member, directory, numeric_owner=False)
+                        tar.utime(member, directory)
+                        tar.chmod(member, directory)
+                    except tarfile.ExtractError:
+                        if tar.errorlevel > 1:
+                            raise
 
     # Otherwise assume this is a single compressed file
     # Decompress it and write it using the appropriate
     # method based on its suffix
+    elif decompressor := _find_parallel_decompressor(real_path):
+        with open(real_path.with_suffix(""), "wb") as output_file:
+            subprocess.run(
+                [decompressor, "-dc", str(real_path)], stdout=output_file, check=True
+            )
+
     else:
         compressed_open: Callable | None = None
         if real_path.suffix == ".bz2":
             compressed_open = bz2.open
         elif real_path.suffix == ".gz":
-            compressed_open = gzip.open
+            compressed_open = functools.partial(_open_gzip, threads=threads)
 
-        # Get the compressed data and immediately write it back out, stripping
+        # Not a compressed file, so there is nothing to inflate
+        if not compressed_open:
+            return
+
+        # Stream the decompressed bytes straight back out, stripping
         # the compression suffix
-        CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
-        if compressed_open:
-            with compressed_open(real_path, "rb") as compressed_file:
-                with open(real_path.with_suffix(""), "wb") as output_file:
-                    # Read and write data in chunks to conserve memory
-                    while True:
-                        chunk = compressed_file.read(CHUNK_SIZE)
-                        if not chunk:
-                            break
-                        output_file.write(chunk)
+        with (
+            compressed_open(real_path, "rb") as compressed_file,
+            open(real_path.with_suffix(""), "wb") as output_file,
+        ):
+            shutil.copyfileobj(compressed_file, output_file, length=1024 * 1024)
+
+    marker.write_text(stamp)
+
 
-    return
+def _find_parallel_decompressor(real_path: Path) -> str | None:
+    """Return the path to a parallel decompression program for the given file
+    (e.g., `pigz` for .gz files), if one is installed.
+
+    """
+    program = _PARALLEL_DECOMPRESSORS.get(real_path.suffix)
+    if program is None:
+        return None
+    return shutil.which(program)
+
+
+def _open_gzip(
+    real_path: Path, mode: str = "rb", threads: int | None = None
+) -> BinaryIO:
+    """Open a gzipped file for reading, decompressing it in parallel with
+    `rapidgzip` (using `threads` threads, or one per CPU) if it is installed.
+
+    """
+    try:
+        import rapidgzip
+    except ImportError:
+        import gzip
+
+        return gzip.open(real_path, mode)  # type: ignore[return-value]
+    return rapidgzip.open(
+        str(real_path), parallelization=threads or os.cpu_count() or 1
+    )
+
+
+@contextlib.contextmanager
+def _open_tar_stream(real_path: Path, threads: int | None = None) -> Iterator[BinaryIO]:
+    """Open a (possibly compressed) tar archive for streaming.
+
+    Gzipped archives are decompressed in parallel with `rapidgzip` (using
+    `threads` threads, or one per CPU) if it is installed; otherwise the raw
+    file is returned behind a large read buffer and `tarfile` performs the
+    decompression itself.
+
+    """
+    if real_path.suffix in (".gz", ".tgz"):
+        try:
+            import rapidgzip
+        except ImportError:
+            pass
+        else:
+            with rapidgzip.open(
+                str(real_path), parallelization=threads or os.cpu_count() or 1
+            ) as stream:
+                yield stream
+            return
+
+    with (
+        open(real_path, "rb", buffering=0) as raw,
+        io.BufferedReader(raw, buffer_size=1024 * 1024) as buffered,
+    ):
+        yield buffered
+
+
+def _extract_zip_members(
+    zip_path: Path, destination: Path, max_workers: int = 8
+) -> None:
+    """Extract all regular files from a zip archive into `destination`,
+    writing several members at once (within the shared `_INFLATE_WRITE_SLOTS`).
+
+    Parent directories are created up-front so that the extraction
+    threads never race on `mkdir`. Symlinks and device files are skipped.
+    Each thread reads from its own handle on the archive, as `ZipFile` does
+    not support concurrent reads through a single one.
+
+    Raises:
+        RuntimeError: If any member would be extracted outside of `destination`.
+
+    """
+    members: list[zipfile.ZipInfo] = []
+    directories: set[Path] = set()
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+    for info in infos:
+        member_path = PurePosixPath(info.filename)
+        if member_path.is_absolute() or ".." in member_path.parts:
+            raise RuntimeError(
+                f"Refusing to extract {info.filename!r} outside of {destination}"
+            )
+
+        mode = info.external_attr >> 16
+        if stat.S_ISLNK(mode) or stat.S_ISCHR(mode) or stat.S_ISBLK(mode):
+            continue
+        if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode):
+            continue
+
+        if info.is_dir():
+            directories.add(destination / member_path)
+        else:
+            directories.add(destination / member_path.parent)
+            members.append(info)
+
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    local = threading.local()
+    handles: list[zipfile.ZipFile] = []
+
+    def extract(info: zipfile.ZipInfo) -> None:
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            handles.append(zip_ref)
+        with _INFLATE_WRITE_SLOTS:
+            zip_ref.extract(info, destination)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(extract, info) for info in members]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _list_directory(directory: Path) -> tuple[str, ...]:
+    """Return the names of all entries in `directory` (empty if it does not exist).
+
+    Cached so that several patterns in the same directory share a single
+    `os.scandir` pass; see `_clear_match_caches`.
+
+    """
+    try:
+        with os.scandir(directory) as it:
+            return tuple(entry.name for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_glob(root: Path, pattern: str) -> tuple[Path, ...]:
+    """Return the sorted paths under `root` that match the glob `pattern`.
+
+    Patterns that only contain wildcards in their final component are
+    matched against a cached listing of their parent directory, with a
+    plain suffix check for simple patterns such as `*.cif`;
+    anything else (e.g., recursive `**` patterns) falls back to `Path.glob`.
+
+    """
+    parent, _, name = pattern.rpartition("/")
+    if not any(c in parent for c in "*?[") and "**" not in name:
+        directory = root / parent if parent else root
+        suffix = name[1:]
+        if name.startswith("*") and not any(c in suffix for c in "*?["):
+            # simple `*<suffix>` patterns only need a string comparison
+            names = [e for e in _list_directory(directory) if e.endswith(suffix)]
+        else:
+            names = [
+                e for e in _list_directory(directory) if fnmatch.fnmatchcase(e, name)
+            ]
+        # sibling paths sort in the same order as their names
+        return tuple(directory / entry for entry in sorted(names))
+
+    return tuple(sorted(root.glob(pattern)))
+
+
+def _clear_match_caches() -> None:
+    """Forget any cached directory listings, e.g., after inflating archives."""
+    _list_directory.cache_clear()
+    _cached_glob.cache_clear()
 
 
 def _get_matches(
@@ -200,26 +706,68 @@ def _get_matches(
         a list of paths found within that archive.
 
     """
+    archive_root = Path(archive_path)
     matches_by_file: dict[str | None, list[Path]] = defaultdict(list)
     for path in paths:
         matches = path.matches or []
         for m in matches:
             if "*" in m:
-                wildcard = sorted(list(Path(archive_path).glob(m)))
+                wildcard = _cached_glob(archive_root, m)
                 if not wildcard:
                     raise FileNotFoundError(
                         f"Could not find any files matching wildcard {m!r}"
                     )
-                matches_by_file[path.file] += wildcard
+                matches_by_file[path.file].extend(wildcard)
             else:
-                matches_by_file[path.file] += [Path(archive_path) / m]
+                matches_by_file[path.file].append(archive_root / m)
 
         if not matches:
-            matches_by_file[path.file] += [Path(archive_path) / path.file]
+            matches_by_file[path.file].append(archive_root / path.file)
 
     return matches_by_file
 
 
+def _get_checked_matches(
+    archive_path: Path, entry_config: EntryConfig
+) -> tuple[dict[str | None, list[Path]], dict[str | None, list[Path]]]:
+    """Collect the entry and property files for an entry specification.
+
+    Raises:
+        FileNotFoundError: If any of the files are missing.
+
+    """
+    entry_matches_by_file = _get_matches(archive_path, entry_config.entry_paths)
+    _check_missing(entry_matches_by_file)
+
+    property_matches_by_file = _get_matches(archive_path, entry_config.property_paths)
+    _check_missing(property_matches_by_file)
+
+    return entry_matches_by_file, property_matches_by_file
+
+
+def _collect_matches(
+    archive_path: Path, entries_by_type: dict[str, list[EntryConfig]]
+) -> dict[
+    str,
+    list[
+        tuple[EntryConfig, dict[str | None, list[Path]], dict[str | None, list[Path]]]
+    ],
+]:
+    """Collect and check the entry and property files for each entry
+    specification, grouped by entry type.
+
+    Raises:
+        FileNotFoundError: If any of the files are missing.
+
+    """
+    return {
+        entry_type: [
+            (entry, *_get_checked_matches(archive_path, entry)) for entry in entries
+        ]
+        for entry_type, entries in entries_by_type.items()
+    }
+
+
 def _check_missing(matches_by_file: dict[str | None, list[Path]]) -> None:
     """Check if any matching files are missing.
 
@@ -228,79 +776,141 @@ def _check_missing(matches_by_file: dict[str | None, list[Path]]) -> None:
 
     """
     missing_paths = []
+    checked: set[Path] = set()
     for archive_file_path in matches_by_file:
         for _path in matches_by_file[archive_file_path]:
+            if _path in checked:
+                continue
+            checked.add(_path)
             if not _path.exists():
                 missing_paths.append(_path)
     if missing_paths:
         raise FileNotFoundError(f"Could not find the following files: {missing_paths}")
 
 
+def _count_entry_files(
+    matches_by_file: dict[str | None, list[Path]], limit: int | None = None
+) -> int:
+    """Count the files that will be parsed from the matches, given the limit."""
+    return sum(
+        min(len(paths), limit) if limit else len(paths)
+        for paths in matches_by_file.values()
+    )
+
+
+def _parse_entry_file(path: Path, entry_type: str) -> tuple[Any, dict[str, str]]:
+    """Try each of the registered parsers for the given entry type on a
+    single file, returning the first non-empty result.
+
+    This is run inside worker processes, so any parser errors are returned
+    as strings rather than raised.
+
+    Returns:
+        The parsed document (or `None` if no parser succeeded), and a
+        dictionary of errors from each failed parser.
+
+    """
+    from .parsers import ENTRY_PARSER_PREDICATES, get_entry_parsers
+
+    exceptions: dict[str, str] = {}
+    for parser in get_entry_parsers(entry_type, path):
+        can_handle = ENTRY_PARSER_PREDICATES.get(parser)
+        try:
+            if can_handle is not None and not can_handle(path):
+                exceptions[str(parser)] = (
+                    "Skipped, as the file is not in a suitable format"
+                )
+                continue
+            doc = parser(path)
+            if not doc:
+                raise RuntimeError(f"No entries parsed by {parser}")
+            return doc, exceptions
+        except Exception as exc:
+            exceptions[str(parser)] = repr(exc)
+
+    return None, exceptions
+
+
 def _parse_entries(
     archive_path: Path,
     matches_by_file: dict[str | None, list[Path]],
     entry_type: str,
     limit: int | None = None,
+    executor: ProcessPoolExecutor | None = None,
 ) -> tuple[list[Any], list[str]]:
     """Loop through the matches by file and parse them into
     the intermediate format, also generating IDs for each.
 
+    Files are parsed in parallel across a pool of worker processes,
+    but the results are collected in the original order. Fewer than
+    `_MIN_FILES_FOR_PROCESS_POOL` files are parsed serially instead.
+
     Parameters:
         archive_path: The path to the archive.
         matches_by_file: A dictionary of matches by file.
         entry_type: The type of entry to parse.
         limit: The maximum number of entries to parse
+        executor: An existing process pool to parse the files with.
+            If not provided, a new pool will be created if needed.
 
     Returns:
         A list of parsed entries and a list of IDs.
 
     """
-    from .parsers import ENTRY_PARSERS
+    from .parsers import get_entry_parsers
 
     parsed_entries = []
     entry_ids: list[str] = []
-    for archive_file in matches_by_file:
-        for ind, _path in enumerate(
-            tqdm.tqdm(
-                matches_by_file[archive_file],
-                desc=f"Parsing {entry_type} files",
-            )
+    with contextlib.ExitStack() as stack:
+        if (
+            executor is None
+            and _count_entry_files(matches_by_file, limit)
+            >= _MIN_FILES_FOR_PROCESS_POOL
         ):
-            if limit and ind >= limit:
-                break
-
-            path_in_archive: Path = Path(_path).relative_to(Path(archive_path))
-            exceptions = {}
-
-            id_root = (
-                f"{archive_file}/{path_in_archive}"
-                if len(matches_by_file[archive_file]) > 1
-                else str(archive_file)
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=os.cpu_count())
             )
-
-            for parser in ENTRY_PARSERS[entry_type]:
-                try:
-                    doc = parser(_path)
-                    if not doc:
-                        raise RuntimeError(f"No entries parsed by {parser}")
-
-                    if isinstance(doc, list):
-                        parsed_entries.extend(doc)
-                        entry_ids.extend(
-                            [f"{id_root}/{ind}" for ind, _ in enumerate(doc)]
-                        )
-                    else:
-                        parsed_entries.append(doc)
-                        entry_ids.append(id_root)
-                    break
-                except Exception as exc:
-                    exceptions[parser] = exc
-                    continue
+        for archive_file in matches_by_file:
+            paths = (
+                matches_by_file[archive_file][:limit]
+                if limit
+                else matches_by_file[archive_file]
+            )
+            results: Iterator[tuple[Any, dict[str, str]]]
+            if executor is None:
+                results = map(_parse_entry_file, paths, itertools.repeat(entry_type))
             else:
-                raise RuntimeError(
-                    f"None of the provided parsers {ENTRY_PARSERS[entry_type]} could parse {_path}. Errors: {exceptions}"
+                results = executor.map(
+                    _parse_entry_file,
+                    paths,
+                    itertools.repeat(entry_type),
+                    chunksize=16,
+                )
+            for _path, (doc, exceptions) in zip(
+                paths,
+                tqdm.tqdm(
+                    results, total=len(paths), desc=f"Parsing {entry_type} files"
+                ),
+            ):
+                if doc is None:
+                    raise RuntimeError(
+                        f"None of the provided parsers {get_entry_parsers(entry_type, _path)} could parse {_path}. Errors: {exceptions}"
+                    )
+
+                path_in_archive: Path = Path(_path).relative_to(Path(archive_path))
+                id_root = (
+                    f"{archive_file}/{path_in_archive}"
+                    if len(matches_by_file[archive_file]) > 1
+                    else str(archive_file)
                 )
 
+                if isinstance(doc, list):
+                    parsed_entries.extend(doc)
+                    entry_ids.extend([f"{id_root}/{ind}" for ind, _ in enumerate(doc)])
+                else:
+                    parsed_entries.append(doc)
+                    entry_ids.append(id_root)
+
     if len(set(entry_ids)) != len(entry_ids):
         raise RuntimeError(
             "Duplicate entry IDs found even when generated directly from filepaths. This should not be possible."
@@ -367,53 +977,96 @@ def _set_unique_entry_ids(entry_ids: list[str]) -> list[str]:
     return new_ids
 
 
-def _parse_and_assign_properties(
-    optimade_entries: dict[str, EntryResource],
-    property_matches_by_file: dict[str | None, list[Path]],
+def _parse_property_file(
+    path: Path, property_definitions: list[PropertyDefinition]
+) -> tuple[dict[str, dict[str, Any]] | None, list[str]]:
+    """Try each of the registered property parsers on a single file.
+
+    This is run inside worker processes, so any parser errors are returned
+    as strings rather than raised.
+
+    Returns:
+        The properties keyed by ID (or `None` if no parser succeeded), and
+        a list of errors from each failed parser.
+
+    """
+    from .parsers import PROPERTY_PARSERS
+
+    errors: list[str] = []
+    for parser in PROPERTY_PARSERS[path.suffix]:
+        try:
+            return parser(path, property_definitions), errors
+        except Exception as exc:
+            errors.append(repr(exc))
+
+    return None, errors
+
+
+def _merge_properties(
+    paths: list[Path],
+    results: Iterable[tuple[dict[str, dict[str, Any]] | None, list[str]]],
     entry_type: str,
-    property_definitions: list[PropertyDefinition],
-    provider_prefix: str,
-) -> None:
-    """Loop through the property matches by file and parse them into the combined
-    dictionary of OPTIMADE entries.
+) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """Combine the properties parsed from each file into a single dictionary
+    of properties keyed by ID, with later files taking precedence.
+
+    Parameters:
+        paths: The property files, in order.
+        results: The results of `_parse_property_file` for each path.
+        entry_type: The type of entry the properties are for.
+
+    Returns:
+        The parsed properties for each ID, and the set of all property
+        fields found in the data.
 
     """
-    from .parsers import PROPERTY_PARSERS, TYPE_MAP
+    from .parsers import PROPERTY_PARSERS
 
     parsed_properties: dict[str, dict[str, Any]] = defaultdict(dict)
-    errors = []
+    errors: list[str] = []
     all_property_fields: set[str] = set()
 
-    if not property_matches_by_file:
-        return
+    if not paths:
+        return parsed_properties, all_property_fields
 
-    for archive_file in property_matches_by_file:
-        for _path in tqdm.tqdm(
-            property_matches_by_file[archive_file],
+    for _path, (properties, file_errors) in zip(
+        paths,
+        tqdm.tqdm(
+            results,
+            total=len(paths),
             desc=f"Parsing properties for {entry_type} entries",
-        ):
-            file_ext = _path.suffix
-            for parser in PROPERTY_PARSERS[file_ext]:
-                try:
-                    properties = parser(_path, property_definitions)
-                    for id in properties:
-                        parsed_properties[id].update(properties[id])
-                        all_property_fields |= set(properties[id].keys())
-                    break
-                except Exception as exc:
-                    errors.append(exc)
-                    continue
-            else:
-                raise RuntimeError(
-                    f"Could not parse properties file {_path} with any of the provided parsers {PROPERTY_PARSERS[file_ext]}. Errors: {errors}"
-                )
+        ),
+    ):
+        errors.extend(file_errors)
+        if properties is None:
+            raise RuntimeError(
+                f"Could not parse properties file {_path} with any of the provided parsers {PROPERTY_PARSERS[_path.suffix]}. Errors: {errors}"
+            )
+        for id, entry_properties in properties.items():
+            parsed_properties[id].update(entry_properties)
+            all_property_fields.update(entry_properties)
 
     if not parsed_properties:
         raise RuntimeError(
             f"Could not parse properties files with any of the provided parsers. Errors: {errors}"
         )
 
-    # Match properties up to the descrptions provided in the config
+    return parsed_properties, all_property_fields
+
+
+def _prepare_property_keys(
+    all_property_fields: set[str],
+    property_definitions: list[PropertyDefinition],
+    provider_prefix: str,
+) -> dict[str, str]:
+    """Match the properties found in the data up to the definitions provided
+    in the config, warning about any mismatches.
+
+    Returns:
+        A dictionary mapping each defined property found in the data to its
+        served (prefixed) field name.
+
+    """
     property_def_dict: dict[str, PropertyDefinition] = {
         p.name: p for p in property_definitions
     }
@@ -424,29 +1077,61 @@ def _parse_and_assign_properties(
             f"Found {all_property_fields=} in data but {expected_property_fields} in config"
         )
 
+    prefixed: dict[str, str] = {}
+    for property in all_property_fields:
+        if property not in property_def_dict:
+            warnings.warn(f"Missing property definition for {property=}")
+            continue
+        prefixed[property] = f"_{provider_prefix}_{property}"
+
+    return prefixed
+
+
+def _assign_entry_properties(
+    entry: dict,
+    parsed_properties: dict[str, dict[str, Any]],
+    prefixed: dict[str, str],
+    casters: dict[str, Callable[[Any], Any]],
+) -> None:
+    """Assign the parsed properties to a single OPTIMADE entry, casting to
+    the configured types (from `casters`, keyed by property name) and
+    setting any missing values to `None`.
+
+    """
+    id = entry["id"]
+    attrs = entry["attributes"]
     # Look for precisely matching IDs, or 'filename' matches
-    for id in optimade_entries:
-        # detect any other compatible IDs; either those matching immutable ID or those matching the filename rule
-        property_entry_id = optimade_entries[id]["attributes"].get("immutable_id", None)
-        if property_entry_id is None:
-            # try to find a matching ID based on the filename
-            property_entry_id = id.split("/")[-1].split(".")[0]
-
-        # Loop over all defined properties and assign them to the entry, setting to None if missing
-        # Also cast types if provided
-        for property in all_property_fields:
-            # Look up both IDs: the file path-based ID or the ergonomic one
-            # Different property sources can use different ID schemes internally
-            value = parsed_properties.get(property_entry_id, {}).get(
-                property, None
-            ) or parsed_properties.get(id, {}).get(property, None)
-            if property not in property_def_dict:
-                warnings.warn(f"Missing property definition for {property=}")
+    # detect any other compatible IDs; either those matching immutable ID or those matching the filename rule
+    property_entry_id = attrs.get("immutable_id", None)
+    if property_entry_id is None:
+        # try to find a matching ID based on the filename
+        property_entry_id = id.split("/")[-1].split(".")[0]
+
+    # Look up both IDs: the file path-based ID or the ergonomic one
+    # Different property sources can use different ID schemes internally
+    properties_by_entry_id = parsed_properties.get(property_entry_id, {})
+    properties_by_id = parsed_properties.get(id, {})
+
+    # Set all defined properties to None, then fill in only those actually
+    # present for this entry, preferring non-empty values found under the
+    # immutable (file path-based) ID, and casting types if provided
+    attrs.update(dict.fromkeys(prefixed.values()))
+    for properties, skip_empty in (
+        (properties_by_id, False),
+        (properties_by_entry_id, True),
+    ):
+        for property, value in properties.items():
+            if value is None or (skip_empty and not value):
                 continue
-            if value is not None and property_def_dict[property].type in TYPE_MAP:
-                value = TYPE_MAP[property_def_dict[property].type](value)
-
-            optimade_entries[id]["attributes"][f"_{provider_prefix}_{property}"] = value
+            key = prefixed.get(property)
+            if key is None:
+                continue
+            caster = casters.get(property)
+            # values are often already of the right type (e.g., from typed
+            # CSV columns), in which case the conversion can be skipped
+            if caster is not None and type(value) is not caster:
+                value = caster(value)
+            attrs[key] = value
 
 
 def construct_entries(
@@ -454,11 +1139,33 @@ def construct_entries(
     entry_config: EntryConfig,
     provider_prefix: str,
     limit: int | None = None,
-) -> dict[str, dict]:
+    seen_ids: set[str] | None = None,
+    entry_matches_by_file: dict[str | None, list[Path]] | None = None,
+    property_matches_by_file: dict[str | None, list[Path]] | None = None,
+    executor: ProcessPoolExecutor | None = None,
+) -> Iterator[tuple[str, dict]]:
     """Given an archive path and an entry specification,
     loop through the provided paths and try to ingest them
     with the given entry type.
 
+    Parameters:
+        archive_path: The path to the archive.
+        entry_config: The entry specification from the config file.
+        provider_prefix: The prefix to use for custom properties.
+        limit: The maximum number of entries to parse.
+        seen_ids: The IDs of any entries already constructed, used to check
+            for duplicates; newly constructed IDs are added to this set.
+        entry_matches_by_file: The already collected (and checked) entry
+            files, as returned by `_get_matches`. If not provided, these
+            are collected from the entry config.
+        property_matches_by_file: As above, for the property files.
+        executor: A process pool to parse large inputs in. If not provided,
+            one is started (and shut down) for this entry specification
+            when needed.
+
+    Yields:
+        Pairs of entry ID and OPTIMADE entry, as each entry is constructed.
+
     Raises:
         FileNotFoundError: If any of the data paths in the config
             file do not exist.
@@ -468,7 +1175,12 @@ def construct_entries(
 
     """
 
-    from .parsers import ENTRY_PARSERS, OPTIMADE_CONVERTERS
+    from .parsers import (
+        ENTRY_PARSERS,
+        OPTIMADE_CONVERTERS,
+        TYPE_MAP,
+        get_optimade_converters,
+    )
 
     if entry_config.entry_type not in ENTRY_PARSERS:
         raise RuntimeError(f"Parsing type {entry_config.entry_type} is not supported.")
@@ -478,39 +1190,93 @@ def construct_entries(
             f"Converting type {entry_config.entry_type} is not supported."
         )
 
-    # Collect entry paths using glob/explicit syntax
-    entry_matches_by_file = _get_matches(archive_path, entry_config.entry_paths)
-    _check_missing(entry_matches_by_file)
+    # Collect entry and property paths using glob/explicit syntax
+    if entry_matches_by_file is None or property_matches_by_file is None:
+        entry_matches_by_file, property_matches_by_file = _get_checked_matches(
+            archive_path, entry_config
+        )
 
-    # Parse into intermediate format
-    parsed_entries, file_path_entry_ids = _parse_entries(
-        archive_path,
-        entry_matches_by_file,
-        entry_config.entry_type,
-        limit=limit,
+    property_paths = list(
+        itertools.chain.from_iterable(property_matches_by_file.values())
+    )
+    property_args = (
+        property_paths,
+        itertools.repeat(entry_config.property_definitions),
     )
 
+    if _count_entry_files(entry_matches_by_file, limit) < _MIN_FILES_FOR_PROCESS_POOL:
+        # Parse small inputs serially, as starting the worker processes
+        # would take longer than the parsing itself
+        parsed_properties, all_property_fields = _merge_properties(
+            property_paths,
+            map(_parse_property_file, *property_args),
+            entry_config.entry_type,
+        )
+        parsed_entries, file_path_entry_ids = _parse_entries(
+            archive_path, entry_matches_by_file, entry_config.entry_type, limit=limit
+        )
+
+    else:
+        with (
+            contextlib.nullcontext(executor)
+            if executor is not None
+            else ProcessPoolExecutor(max_workers=os.cpu_count())
+        ) as executor:
+            # Queue each property file to be parsed in the worker processes
+            # alongside the entries themselves
+            property_results = executor.map(_parse_property_file, *property_args)
+
+            # Parse into intermediate format
+            parsed_entries, file_path_entry_ids = _parse_entries(
+                archive_path,
+                entry_matches_by_file,
+                entry_config.entry_type,
+                limit=limit,
+                executor=executor,
+            )
+
+            parsed_properties, all_property_fields = _merge_properties(
+                property_paths, property_results, entry_config.entry_type
+            )
+
     # Generate a better set of entry IDs
     unique_entry_ids = _set_unique_entry_ids(file_path_entry_ids)
 
-    # Parse properties
-    property_matches_by_file: dict[str | None, list[Path]] = _get_matches(
-        archive_path, entry_config.property_paths
-    )
-    _check_missing(property_matches_by_file)
+    # Match the parsed properties up to their definitions once, so that
+    # they can be assigned to each entry as it is constructed
+    prefixed: dict[str, str] = {}
+    if parsed_properties:
+        prefixed = _prepare_property_keys(
+            all_property_fields, entry_config.property_definitions, provider_prefix
+        )
+    casters: dict[str, Callable[[Any], Any]] = {
+        p.name: TYPE_MAP[p.type]
+        for p in entry_config.property_definitions
+        if p.type in TYPE_MAP
+    }
 
     timestamp = datetime.datetime.now().isoformat()
 
     # Construct OPTIMADE entries from intermediate format
-    optimade_entries: dict[str, EntryResource] = {}
+    if seen_ids is None:
+        seen_ids = set()
+    entry_type = entry_config.entry_type
+    property_definitions = entry_config.property_definitions
+    # the converters only depend on the type of each parsed entry, of which
+    # there are usually only one or two
+    converters_by_type: dict[type, list] = {}
     for file_path_entry_id, unique_entry_id, entry in tqdm.tqdm(
         zip(file_path_entry_ids, unique_entry_ids, parsed_entries),
-        desc=f"Constructing OPTIMADE {entry_config.entry_type} entries",
+        desc=f"Constructing OPTIMADE {entry_type} entries",
     ):
         exceptions = {}
-        for converter in OPTIMADE_CONVERTERS[entry_config.entry_type]:
+        converters = converters_by_type.get(type(entry))
+        if converters is None:
+            converters = get_optimade_converters(entry_type, entry)
+            converters_by_type[type(entry)] = converters
+        for converter in converters:
             try:
-                entry = converter(entry, properties=entry_config.property_definitions)  # type: ignore[call-arg]
+                entry = converter(entry, properties=property_definitions)  # type: ignore[call-arg]
                 if not isinstance(entry, dict):
                     entry = entry.entry
                 break
@@ -519,11 +1285,11 @@ def construct_entries(
                 continue
         else:
             raise RuntimeError(
-                f"Could not convert entry {entry} with any of the provided converters: {OPTIMADE_CONVERTERS[entry_config.entry_type]}. Errors: {exceptions}"
+                f"Could not convert entry {file_path_entry_id!r} ({type(entry).__name__}) with any of the provided converters: {converters}. Errors: {exceptions}"
             )
 
         if not isinstance(entry, dict):
-            entry = entry.dict()
+            entry = entry.model_dump()
 
         if not entry["id"]:
             entry["id"] = unique_entry_id
@@ -532,26 +1298,123 @@ def construct_entries(
             # so this should also be used for the immutable ID
             entry["attributes"]["immutable_id"] = entry["id"]
 
-        if entry["id"] in optimade_entries:
+        if entry["id"] in seen_ids:
             raise RuntimeError(f"Duplicate entry ID found: {entry['id']}")
-
-        optimade_entries[entry["id"]] = entry
+        seen_ids.add(entry["id"])
 
         if not entry["attributes"].get("immutable_id"):
             entry["attributes"]["immutable_id"] = file_path_entry_id
 
         entry["attributes"]["last_modified"] = timestamp
 
-    # Now try to parse the properties and assign them to OPTIMADE entries
-    _parse_and_assign_properties(
-        optimade_entries,
-        property_matches_by_file,
-        entry_config.entry_type,
-        entry_config.property_definitions,
-        provider_prefix,
+        # Now assign the parsed properties to the OPTIMADE entry
+        if prefixed:
+            _assign_entry_properties(entry, parsed_properties, prefixed, casters)
+
+        yield entry["id"], entry
+
+
+def _serialize_entry(entry_dict: dict) -> bytes:
+    """Serialize an OPTIMADE entry as a single JSONL line, dropping any internal
+    ASE fields.
+
+    """
+    # Strip internal ASE fields in place; the set of keys can
+    # differ between entries (e.g., `Atoms.info` contents), so
+    # it is re-scanned for each entry
+    attributes = entry_dict["attributes"]
+    for k in [k for k in attributes if str(k).startswith(_ASE_PREFIX)]:
+        del attributes[k]
+    # data merged verbatim from the parsed files may be keyed by e.g. integers
+    return (
+        orjson.dumps(
+            entry_dict, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        + b"\n"
     )
 
-    return optimade_entries
+
+def _serialize_jsonl_header(
+    property_definitions: dict[str, list[PropertyDefinition]],
+    provider_prefix: str,
+) -> Iterator[bytes]:
+    """Yield the JSONL header line, followed by an info line for each entry type."""
+    header = {"x-optimade": {"meta": {"api_version": OPTIMADE_API_VERSION}}}
+    yield orjson.dumps(header) + b"\n"
+
+    for entry_type in property_definitions:
+        entry_info = _construct_entry_type_info(
+            entry_type, property_definitions[entry_type], provider_prefix
+        )
+        yield orjson.dumps(entry_info.model_dump(mode="json")) + b"\n"
+
+
+class _JSONLWriter:
+    """Writes serialized JSONL lines to a file from a background thread, so
+    that disk writes overlap with the construction of further entries.
+
+    Lines are collected into a buffer that is handed to the thread whenever
+    it exceeds `flush_size` bytes, and written to a temporary file alongside
+    the target path, which is only moved into place if the writer is closed
+    without error.
+
+    """
+
+    def __init__(self, path: Path, flush_size: int = 4 * 1024 * 1024, maxsize: int = 4):
+        self.path = path
+        self._tmp_path = path.with_name(f".{path.name}.tmp")
+        self._buffer = bytearray()
+        self._flush_size = flush_size
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=maxsize)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_JSONLWriter":
+        # the lines are already batched, so write each batch straight through
+        self._file = open(self._tmp_path, "wb", buffering=0)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            payload = self._queue.get()
+            if payload is None:
+                break
+            # keep draining the queue after a failure so producers never block
+            if self._error is None:
+                try:
+                    # unbuffered writes may be partial, so loop until done
+                    view = memoryview(payload)
+                    while view:
+                        view = view[self._file.write(view) or 0 :]
+                except BaseException as exc:
+                    self._error = exc
+
+    def write(self, payload: bytes) -> None:
+        """Queue a serialized line to be written."""
+        self._buffer += payload
+        if len(self._buffer) > self._flush_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._buffer:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None and self._error is None:
+            self._flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if exc_type is None and self._error is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+        if exc_type is None and self._error is not None:
+            raise self._error
 
 
 def write_optimade_jsonl(
@@ -575,37 +1438,22 @@ def write_optimade_jsonl(
         RuntimeError: If the JSONL file already exists.
 
     """
-    import json
-
     if not jsonl_path:
         jsonl_path = archive_path / "optimade.jsonl"
 
     if jsonl_path.exists():
         raise RuntimeError(f"Not overwriting existing file at {jsonl_path}")
 
-    with open(jsonl_path, "a") as jsonl:
+    # write through the same background writer as `convert_archive`, so that
+    # disk writes overlap with serialization and no partial file is left behind
+    with _JSONLWriter(jsonl_path) as writer:
         # write the optimade jsonl header
-        header = {"x-optimade": {"meta": {"api_version": OPTIMADE_API_VERSION}}}
-        jsonl.write(json.dumps(header))
-        jsonl.write("\n")
-
-        for entry_type in property_definitions:
-            entry_info = _construct_entry_type_info(
-                entry_type, property_definitions[entry_type], provider_prefix
-            )
-            jsonl.write(entry_info.model_dump_json())
-            jsonl.write("\n")
+        for line in _serialize_jsonl_header(property_definitions, provider_prefix):
+            writer.write(line)
 
         for entry_type in optimade_entries:
             if optimade_entries[entry_type]:
                 for entry_dict in optimade_entries[entry_type]:
-                    attributes = {
-                        k: entry_dict["attributes"][k]
-                        for k in entry_dict["attributes"]
-                        if not k.startswith("_ase")
-                    }
-                    entry_dict["attributes"] = attributes
-                    jsonl.write(json.dumps(entry_dict))
-                    jsonl.write("\n")
+                    writer.write(_serialize_entry(entry_dict))  # type: ignore[arg-type]
 
     return jsonl_path
@@ -1,7 +1,10 @@
+import functools
+import re
 from pathlib import Path
 from typing import Any, Callable
 
 try:
+    import ase
     import ase.io
     import pandas
     import pymatgen.core
@@ -13,7 +16,9 @@ except ImportError as exc:
     ) from exc
 
 from optimade.adapters import Structure
-from optimade.models import EntryResource
+from optimade.adapters.structures.ase import from_ase_atoms
+from optimade.adapters.structures.pymatgen import from_pymatgen
+from optimade.models import EntryResource, StructureResource
 
 from optimade_maker.config import PropertyDefinition
 
@@ -36,7 +41,7 @@ def load_csv_file(
         A dictionary of ID -> properties.
 
     """
-    df = pandas.read_csv(p)
+    df = pandas.read_csv(p, engine="c", low_memory=False)
     id_key = "id"
     if "id" not in df:
         id_keys = [f for f in df.columns if "id" in f.lower()]
@@ -59,7 +64,25 @@ def load_csv_file(
                 df[prop.name] = df[alias]
                 break
 
-    return df.to_dict(orient="index")
+    # Cast whole numeric columns that are declared as floats in one go,
+    # rather than converting each value as it is assigned to an entry
+    for prop in properties or []:
+        if (
+            prop.type == "float"
+            and prop.name in df
+            and pandas.api.types.is_numeric_dtype(df[prop.name])
+        ):
+            df[prop.name] = df[prop.name].astype(float)
+
+    if not df.index.is_unique:
+        raise ValueError(f"CSV file {p} contains duplicate IDs")
+
+    # Convert each column to native Python values in one pass, then
+    # transpose into per-ID dictionaries (equivalent to `to_dict("index")`)
+    columns = list(df.columns)
+    values = [df.iloc[:, i].tolist() for i in range(len(columns))]
+    rows = zip(*values) if values else ((),) * len(df)
+    return {id: dict(zip(columns, row)) for id, row in zip(df.index.tolist(), rows)}
 
 
 PROPERTY_PARSERS: dict[
@@ -111,16 +134,88 @@ def wrapped_json_parser(parser):
     return _wrapped_json_parser
 
 
+parse_computed_structure_entries_json = wrapped_json_parser(
+    pymatgen.entries.computed_entries.ComputedStructureEntry.from_dict
+)
+parse_pymatgen_structures_json = wrapped_json_parser(pymatgen.core.Structure.from_dict)
+
+_JSON_CLASS_PATTERN = re.compile(rb'"@class"\s*:\s*"([^"]+)"')
+
+
+def _sniff_json_class(path: Path, size: int = 64 * 1024) -> str | None:
+    """Return the first pymatgen `@class` named near the start of a JSON file, if any."""
+    with open(path, "rb") as f:
+        match = _JSON_CLASS_PATTERN.search(f.read(size))
+    return match.group(1).decode(errors="replace") if match else None
+
+
+def _json_class_predicate(rejected_class: str) -> Callable[[Path], bool]:
+    """Return a predicate that rejects JSON files whose first serialized
+    pymatgen object is of the `rejected_class`.
+
+    Any other (or no) class is not rejected, as it may e.g. belong to
+    metadata stored alongside the list of entries.
+
+    """
+
+    def can_handle(path: Path) -> bool:
+        return _sniff_json_class(path) != rejected_class
+
+    return can_handle
+
+
 ENTRY_PARSERS: dict[str, list[Callable[[Path], Any]]] = {
     "structures": [
         ase.io.read,
-        wrapped_json_parser(
-            pymatgen.entries.computed_entries.ComputedStructureEntry.from_dict
-        ),
-        wrapped_json_parser(pymatgen.core.Structure.from_dict),
+        parse_computed_structure_entries_json,
+        parse_pymatgen_structures_json,
     ],
 }
 
+# ASE formats for common file suffixes, passed explicitly to `ase.io.read`
+# to avoid it sniffing the contents of every file to detect the format
+ASE_FORMATS_BY_SUFFIX: dict[str, str] = {
+    ".cif": "cif",
+    ".xyz": "extxyz",
+    ".extxyz": "extxyz",
+    ".vasp": "vasp",
+    ".pdb": "proteindatabank",
+    ".xsf": "xsf",
+    ".cell": "castep-cell",
+}
+
+# Parsers to use for particular file suffixes, skipping those that cannot apply;
+# files with any other suffix are tried against all of the `ENTRY_PARSERS`
+ENTRY_PARSERS_BY_SUFFIX: dict[str, dict[str, list[Callable[[Path], Any]]]] = {
+    "structures": {
+        ".json": [
+            parse_computed_structure_entries_json,
+            parse_pymatgen_structures_json,
+            ase.io.read,
+        ],
+        **{
+            suffix: [functools.partial(ase.io.read, format=format)]
+            for suffix, format in ASE_FORMATS_BY_SUFFIX.items()
+        },
+    },
+}
+
+
+# Cheap checks of whether a parser could possibly handle a given file, used to
+# skip parsers that would otherwise have to read the whole file before failing;
+# parsers without an entry here are always tried
+ENTRY_PARSER_PREDICATES: dict[Callable[[Path], Any], Callable[[Path], bool]] = {
+    parse_computed_structure_entries_json: _json_class_predicate("Structure"),
+    parse_pymatgen_structures_json: _json_class_predicate("ComputedStructureEntry"),
+}
+
+
+def get_entry_parsers(entry_type: str, path: Path) -> list[Callable[[Path], Any]]:
+    """Return the parsers to try, in order, for the given file and entry type."""
+    return ENTRY_PARSERS_BY_SUFFIX.get(entry_type, {}).get(
+        path.suffix.lower(), ENTRY_PARSERS[entry_type]
+    )
+
 
 def parse_computed_structure_entry(
     pmg_entry: ComputedStructureEntry,
@@ -128,7 +223,7 @@ def parse_computed_structure_entry(
 ) -> dict:
     """Convert a pymatgen ComputedStructureEntry to an OPTIMADE EntryResource."""
 
-    entry = Structure.ingest_from(pmg_entry.structure).entry.dict()
+    entry = structure_ingest_wrapper(pmg_entry.structure)
     entry["attributes"].update(pmg_entry.data)
     entry["attributes"]["energy"] = pmg_entry.energy
     # try to find any unique ID fields and use it to overwrite the generated one
@@ -151,8 +246,23 @@ def parse_computed_structure_entry(
     return entry
 
 
-def structure_ingest_wrapper(entry, properties=None):  # type: ignore
-    return Structure.ingest_from(entry)
+# Functions that build validated OPTIMADE structure attributes from each type
+STRUCTURE_INGESTERS: dict[type, Callable[[Any], Any]] = {
+    ase.Atoms: from_ase_atoms,
+    pymatgen.core.Structure: from_pymatgen,
+}
+
+
+def structure_ingest_wrapper(entry, properties=None) -> dict:  # type: ignore
+    ingester = STRUCTURE_INGESTERS.get(type(entry))
+    if ingester is None:
+        return Structure.ingest_from(entry).entry.model_dump()
+
+    # The attributes have already been validated by the ingester, so skip
+    # validating them a second time as part of the full resource
+    return StructureResource.model_construct(
+        id="", type="structures", attributes=ingester(entry)
+    ).model_dump()
 
 
 OPTIMADE_CONVERTERS: dict[
@@ -160,3 +270,26 @@ OPTIMADE_CONVERTERS: dict[
 ] = {
     "structures": [structure_ingest_wrapper, parse_computed_structure_entry],
 }
+
+# Converters to use for particular intermediate types; any other type is
+# tried against all of the `OPTIMADE_CONVERTERS`
+OPTIMADE_CONVERTERS_BY_TYPE: dict[
+    str,
+    dict[type, Callable[[Any, list[PropertyDefinition] | None], EntryResource | dict]],
+] = {
+    "structures": {
+        ase.Atoms: structure_ingest_wrapper,
+        pymatgen.core.Structure: structure_ingest_wrapper,
+        ComputedStructureEntry: parse_computed_structure_entry,
+    },
+}
+
+
+def get_optimade_converters(
+    entry_type: str, entry: Any
+) -> list[Callable[[Any, list[PropertyDefinition] | None], EntryResource | dict]]:
+    """Return the converters to try, in order, for the given intermediate entry."""
+    converter = OPTIMADE_CONVERTERS_BY_TYPE.get(entry_type, {}).get(type(entry))
+    if converter is not None:
+        return [converter]
+    return OPTIMADE_CONVERTERS[entry_type]
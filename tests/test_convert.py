@@ -27,7 +27,11 @@ def test_convert_example_archives(archive_path, tmp_path):
     jsonl_path = convert_archive(tmp_path)
     assert jsonl_path.exists()
 
-    jsonl_path_custom = convert_archive(tmp_path, jsonl_path=tmp_path / "test.jsonl")
+    # convert again without the cache, so that the archive is really converted
+    # a second time (e.g., with any compressed data paths already inflated)
+    jsonl_path_custom = convert_archive(
+        tmp_path, jsonl_path=tmp_path / "test.jsonl", use_cache=False
+    )
     assert jsonl_path_custom.exists()
 
     first_entry_path = archive_path / ".testing" / "first_entry.json"
@@ -158,3 +162,340 @@ def test_unique_id_generator():
         "set2/3.xyz",
         "set2/4.xyz",
     ]
+
+
+def test_inflate_zip_rejects_path_traversal(tmp_path):
+    """Check that zip members pointing outside of the archive are not extracted."""
+    import zipfile
+
+    from optimade_maker.convert import inflate_archive
+
+    with zipfile.ZipFile(tmp_path / "bad.zip", "w") as zip_ref:
+        zip_ref.writestr("structures/1.cif", "data")
+        zip_ref.writestr("../escaped.txt", "data")
+
+    with pytest.raises(RuntimeError, match="outside"):
+        inflate_archive(tmp_path, Path("bad.zip"))
+
+    assert not (tmp_path.parent / "escaped.txt").exists()
+
+
+def test_entry_parser_dispatch(tmp_path):
+    """Check that parsers are selected by file suffix, falling back to all parsers,
+    and that JSON parsers are skipped for files of the wrong pymatgen class.
+
+    """
+    from optimade_maker.parsers import (
+        ENTRY_PARSER_PREDICATES,
+        ENTRY_PARSERS,
+        get_entry_parsers,
+        parse_computed_structure_entries_json,
+        parse_pymatgen_structures_json,
+    )
+
+    assert len(get_entry_parsers("structures", Path("1.cif"))) == 1
+    assert get_entry_parsers("structures", Path("1.XYZ"))[0].keywords == {
+        "format": "extxyz"
+    }
+    assert (
+        get_entry_parsers("structures", Path("part_1.json"))[0]
+        is not (ENTRY_PARSERS["structures"][0])
+    )
+    assert (
+        get_entry_parsers("structures", Path("POSCAR")) is ENTRY_PARSERS["structures"]
+    )
+
+    structures = tmp_path / "structures.json"
+    structures.write_text(
+        '[{"@module": "pymatgen.core.structure", "@class": "Structure"}]'
+    )
+    assert ENTRY_PARSER_PREDICATES[parse_pymatgen_structures_json](structures)
+    assert not ENTRY_PARSER_PREDICATES[parse_computed_structure_entries_json](
+        structures
+    )
+
+    # other classes (e.g., in metadata before the entries) do not rule out a parser
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(
+        '{"meta": {"@class": "Provenance"}, "structures": [{"@class": "Structure"}]}'
+    )
+    assert ENTRY_PARSER_PREDICATES[parse_pymatgen_structures_json](wrapped)
+    assert ENTRY_PARSER_PREDICATES[parse_computed_structure_entries_json](wrapped)
+
+    # undecodable class names do not raise
+    invalid = tmp_path / "invalid.json"
+    invalid.write_bytes(b'[{"@class": "\xff"}]')
+    assert ENTRY_PARSER_PREDICATES[parse_pymatgen_structures_json](invalid)
+
+    # and neither do errors from the predicates, which are reported instead
+    from optimade_maker.convert import _parse_entry_file
+
+    doc, exceptions = _parse_entry_file(tmp_path / "missing.json", "structures")
+    assert doc is None
+    assert any("FileNotFoundError" in e for e in exceptions.values())
+
+
+def test_convert_reuses_cached_output(tmp_path):
+    """Check that converting unchanged inputs reuses the cached JSONL file,
+    that modifying a data file invalidates it (replacing the stale entry),
+    and that the cache can be bypassed.
+
+    """
+    import os
+
+    archive_path = tmp_path / "xyz_files_no_compression"
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / archive_path.name, archive_path
+    )
+
+    first = convert_archive(archive_path)
+    second = convert_archive(archive_path, jsonl_path=tmp_path / "second.jsonl")
+    assert first.read_bytes() == second.read_bytes()
+    assert os.path.samefile(first, second)
+
+    data_file = archive_path / "H_1.xyz"
+    stat_result = data_file.stat()
+    os.utime(data_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+    third = convert_archive(archive_path, jsonl_path=tmp_path / "third.jsonl")
+    assert not os.path.samefile(first, third)
+    assert first.exists()
+    cached = list((archive_path / ".optimake_cache").glob("*.jsonl"))
+    assert len(cached) == 1 and os.path.samefile(cached[0], third)
+
+    fourth = convert_archive(
+        archive_path, jsonl_path=tmp_path / "fourth.jsonl", use_cache=False
+    )
+    assert not os.path.samefile(third, fourth)
+    assert list((archive_path / ".optimake_cache").glob("*.jsonl")) == cached
+
+
+def test_inflate_skips_unchanged_archives(tmp_path):
+    """Check that an archive is only inflated again once it has changed,
+    or when forced.
+
+    """
+    import gzip
+    import os
+
+    from optimade_maker.convert import inflate_archive
+
+    compressed = tmp_path / "data.txt.gz"
+    compressed.write_bytes(gzip.compress(b"data"))
+
+    inflate_archive(tmp_path, Path("data.txt.gz"))
+    assert (tmp_path / "data.txt").read_bytes() == b"data"
+
+    (tmp_path / "data.txt").unlink()
+    inflate_archive(tmp_path, Path("data.txt.gz"))
+    assert not (tmp_path / "data.txt").exists()
+    inflate_archive(tmp_path, Path("data.txt.gz"), force=True)
+    assert (tmp_path / "data.txt").read_bytes() == b"data"
+
+    stat_result = compressed.stat()
+    os.utime(compressed, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    inflate_archive(tmp_path, Path("data.txt.gz"))
+    assert (tmp_path / "data.txt").read_bytes() == b"data"
+
+
+def test_get_matches_keeps_pattern_order(tmp_path):
+    """Check that wildcard matches are sorted within each pattern, while the
+    patterns themselves keep the order given in the config (which determines
+    e.g. which property file takes precedence).
+
+    """
+    from optimade_maker.config import ParsedFiles
+    from optimade_maker.convert import _clear_match_caches, _get_matches
+
+    for name in ("b/2.cif", "b/1.cif", "a/1.cif"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).touch()
+    _clear_match_caches()
+
+    matches = _get_matches(
+        tmp_path, [ParsedFiles(file="archive.zip", matches=["b/*.cif", "a/1.cif"])]
+    )
+    assert matches["archive.zip"] == [
+        tmp_path / "b/1.cif",
+        tmp_path / "b/2.cif",
+        tmp_path / "a/1.cif",
+    ]
+
+
+def test_convert_relative_archive_path(tmp_path, monkeypatch):
+    """Check that an archive given by a relative path (as from the CLI) converts."""
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / "zip_of_cif",
+        tmp_path / "zip_of_cif",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    jsonl_path = convert_archive(Path("zip_of_cif"))
+    assert jsonl_path.exists()
+
+
+def test_cached_glob_wildcards_in_directories(tmp_path):
+    """Check that wildcards in directory components match as with `Path.glob`."""
+    from optimade_maker.convert import _cached_glob, _clear_match_caches
+
+    for name in ("d1/a.cif", "d2/b.cif"):
+        (tmp_path / name).parent.mkdir()
+        (tmp_path / name).touch()
+    _clear_match_caches()
+
+    for pattern in ("d?/*.cif", "d[12]/*.cif", "*/*.cif"):
+        assert _cached_glob(tmp_path, pattern) == tuple(sorted(tmp_path.glob(pattern)))
+        assert len(_cached_glob(tmp_path, pattern)) == 2
+
+
+def test_convert_reinflates_removed_files(tmp_path):
+    """Check that archives are inflated again if their extracted files have
+    been removed since a previous conversion.
+
+    """
+    import os
+
+    archive_path = tmp_path / "simple_zip_of_cif"
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / archive_path.name, archive_path
+    )
+    convert_archive(archive_path)
+
+    shutil.rmtree(archive_path / "cifs")
+    config = archive_path / "optimade.yaml"
+    stat_result = config.stat()
+    os.utime(config, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+
+    jsonl_path = convert_archive(archive_path, jsonl_path=tmp_path / "second.jsonl")
+    assert jsonl_path.exists()
+    assert (archive_path / "cifs").is_dir()
+
+
+def test_convert_with_process_pool(tmp_path, monkeypatch):
+    """Check that parsing the entry and property files in a process pool gives
+    the same entries as parsing them in the main process.
+
+    """
+    import optimade_maker.convert
+
+    archive_path = tmp_path / "zip_of_cif"
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / archive_path.name, archive_path
+    )
+
+    def read_entries(jsonl_path):
+        entries = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        for entry in entries:
+            entry.get("attributes", {}).pop("last_modified", None)
+        return entries
+
+    serial = convert_archive(
+        archive_path, jsonl_path=tmp_path / "serial.jsonl", use_cache=False
+    )
+    monkeypatch.setattr(optimade_maker.convert, "_MIN_FILES_FOR_PROCESS_POOL", 0)
+    parallel = convert_archive(
+        archive_path, jsonl_path=tmp_path / "parallel.jsonl", use_cache=False
+    )
+
+    assert read_entries(parallel) == read_entries(serial)
+
+
+def test_serialize_entry_with_non_str_keys():
+    """Check that entries with non-string keys (e.g., from pymatgen entry data)
+    and numpy values can be serialized, with internal ASE fields removed.
+
+    """
+    from optimade_maker.convert import _serialize_entry
+
+    entry = {
+        "id": "1",
+        "type": "structures",
+        "attributes": {
+            1: {2: np.float64(1.5)},
+            "energies": np.array([1.0, 2.0]),
+            "_ase_info": {},
+        },
+    }
+    assert json.loads(_serialize_entry(entry)) == {
+        "id": "1",
+        "type": "structures",
+        "attributes": {"1": {"2": 1.5}, "energies": [1.0, 2.0]},
+    }
+
+
+def test_convert_jsonl_reinflates_removed_file(tmp_path):
+    """Check that a compressed JSONL file is extracted again if the extracted
+    file has been removed since a previous conversion.
+
+    """
+    archive_path = tmp_path / "direct_from_jsonl_gz"
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / archive_path.name, archive_path
+    )
+    convert_archive(archive_path, jsonl_path=tmp_path / "first.jsonl")
+
+    (archive_path / "example.jsonl").unlink()
+    jsonl_path = convert_archive(archive_path, jsonl_path=tmp_path / "second.jsonl")
+    assert jsonl_path.exists()
+
+
+def test_convert_without_usable_cache(tmp_path, monkeypatch):
+    """Check that conversion falls back to skipping the cache when its key
+    cannot be computed (e.g., when running from an uninstalled source tree).
+
+    """
+    import optimade_maker.convert
+
+    archive_path = tmp_path / "xyz_files_no_compression"
+    shutil.copytree(
+        Path(__file__).parent.parent / "examples" / archive_path.name, archive_path
+    )
+    monkeypatch.setattr(
+        optimade_maker.convert,
+        "_CACHE_KEY_PACKAGES",
+        ("optimade_maker", "not-an-installed-package"),
+    )
+
+    jsonl_path = convert_archive(archive_path)
+    assert jsonl_path.exists()
+    assert not (archive_path / ".optimake_cache").exists()
+
+
+def test_inflate_tar_sets_directory_attributes(tmp_path):
+    """Check that streamed tar archives still restore directory modification
+    times, as `extractall` would, once all members have been written.
+
+    """
+    import io
+    import tarfile
+
+    from optimade_maker.convert import inflate_archive
+
+    with tarfile.open(tmp_path / "data.tar.gz", "w:gz") as tar:
+        directory = tarfile.TarInfo("data")
+        directory.type = tarfile.DIRTYPE
+        directory.mode = 0o755
+        directory.mtime = 1_000_000
+        tar.addfile(directory)
+        member = tarfile.TarInfo("data/file.txt")
+        member.size = 4
+        tar.addfile(member, io.BytesIO(b"data"))
+
+    inflate_archive(tmp_path, Path("data.tar.gz"))
+    assert (tmp_path / "data" / "file.txt").read_bytes() == b"data"
+    assert (tmp_path / "data").stat().st_mtime == 1_000_000
+
+
+def test_max_concurrent_writes(monkeypatch):
+    """Check that the configured number of concurrent writes is validated."""
+    from optimade_maker.convert import _max_concurrent_writes
+
+    monkeypatch.delenv("OPTIMAKE_MAX_CONCURRENT_WRITES", raising=False)
+    assert _max_concurrent_writes() == 8
+
+    monkeypatch.setenv("OPTIMAKE_MAX_CONCURRENT_WRITES", "0")
+    assert _max_concurrent_writes() == 1
+
+    monkeypatch.setenv("OPTIMAKE_MAX_CONCURRENT_WRITES", "many")
+    with pytest.warns(UserWarning):
+        assert _max_concurrent_writes() == 8